@@ -9,9 +9,19 @@ __version__ = "1.0.0"
 __author__ = "Writer-Editor Team"
 
 from .config import settings
-from .graph import compile_workflow, create_initial_state
 from .ui import CLI
 
+
+def __getattr__(name):
+    # Defer importing the workflow graph (LangGraph and every agent) until
+    # it is actually requested.
+    if name in ("compile_workflow", "create_initial_state"):
+        from . import graph
+
+        return getattr(graph, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "settings",
     "compile_workflow",
@@ -11,7 +11,7 @@ from datetime import datetime
 from src.llm.client import LMStudioClient
 from src.config.settings import settings
 from src.graph.state import WorkflowState, SectionResearch, SearchResult, ContentOutline
-from src.tools.search_tools import SearchProvider, search_multiple_queries, deduplicate_results
+from src.tools.search_tools import SearchProvider, search_multiple_queries
 
 
 class WebSearchAgent:
@@ -105,19 +105,18 @@ Be accurate and objective. Focus on information that will help create high-quali
         Returns:
             SectionResearch TypedDict with search results and summary
         """
-        # Execute all search queries for this section
+        # Execute all search queries for this section, dropping duplicate URLs
         results_by_query = search_multiple_queries(
             queries=search_queries,
             provider=self.search_provider,
-            max_results_per_query=settings.max_search_results_per_query
+            max_results_per_query=settings.max_search_results_per_query,
+            deduplicate=True
         )
 
-        # Combine and deduplicate results
-        all_results = []
+        # Combine the already-deduplicated results
+        unique_results = []
         for results in results_by_query.values():
-            all_results.extend(results)
-
-        unique_results = deduplicate_results(all_results, by="url")
+            unique_results.extend(results)
 
         # Generate summary using LLM
         summary, key_facts = self._summarize_results(
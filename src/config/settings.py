@@ -40,6 +40,8 @@ class Settings(BaseSettings):
     search_api_key: Optional[str] = None  # Required for tavily and serper
     max_search_results_per_query: int = 5
     enable_web_search: bool = True  # Can disable for testing without search
+    search_cache_size: int = 256  # Max cached search queries per process (0 disables)
+    search_cache_ttl_seconds: float = 300.0  # How long cached results stay fresh
 
     # Database Configuration
     checkpoint_db_path: str = "data/checkpoints.sqlite"
@@ -16,13 +16,25 @@ from .state import (
     SectionResearch,
 )
 
-from .workflow import (
-    create_simple_workflow,
-    create_multi_agent_workflow,
-    compile_workflow,
-    create_initial_state,
+_WORKFLOW_NAMES = (
+    "create_simple_workflow",
+    "create_multi_agent_workflow",
+    "compile_workflow",
+    "create_initial_state",
 )
 
+
+def __getattr__(name):
+    # Resolve the workflow functions lazily: workflow imports every agent,
+    # and agents (via src.tools) import src.graph.state, so importing the
+    # state schemas must not pull in workflow.
+    if name in _WORKFLOW_NAMES:
+        from . import workflow
+
+        return getattr(workflow, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # State schemas
     "WorkflowState",
@@ -99,6 +99,9 @@ class SearchResult(TypedDict):
     """
     A single web search result.
 
+    Like the other state schemas this stays a TypedDict (a plain dict at
+    runtime) so results round-trip through LangGraph checkpoints unchanged.
+
     Attributes:
         title: Title of the search result
         url: URL of the source
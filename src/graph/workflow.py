@@ -634,7 +634,10 @@ def compile_workflow(mode: str = "multi-agent") -> Any:
         raise ValueError(f"Unknown workflow mode: {mode}. Use 'simple', 'multi-agent', 'book', or 'tutorial'.")
 
     # Set up checkpointer for state persistence
-    # Use synchronous SQLite connection for SqliteSaver v3.x
+    # Use synchronous SQLite connection for SqliteSaver v3.x.
+    # SqliteSaver only implements the sync checkpoint API, so the compiled
+    # graph must be driven with stream()/invoke(); astream() would require
+    # AsyncSqliteSaver and an aiosqlite connection instead.
     import sqlite3
     conn = sqlite3.connect(settings.checkpoint_db_path, check_same_thread=False)
     checkpointer = SqliteSaver(conn)
@@ -5,7 +5,34 @@ These templates provide structured outlines that guide the Content Strategist
 agent to create consistent, high-quality content structures.
 """
 
-from typing import Dict, List, Any, Optional
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
+
+
+# Keys shared by every template and section dict. Literal keys in this module
+# are already interned by the compiler; interning them explicitly lets us map
+# dynamically built keys (e.g. sections parsed from JSON) onto the same objects.
+_SECTION_KEYS = {
+    sys.intern(key): sys.intern(key)
+    for key in (
+        "name",
+        "description",
+        "sections",
+        "section_id",
+        "title",
+        "purpose",
+        "key_points",
+        "estimated_length",
+        "research_needed",
+        "search_queries",
+    )
+}
+
+
+def _intern_section_keys(section: Dict[str, Any]) -> Dict[str, Any]:
+    """Return section with its known keys replaced by the interned key objects."""
+    return {_SECTION_KEYS.get(key, key): value for key, value in section.items()}
 
 
 # Blog Post Template
@@ -720,8 +747,9 @@ GENERAL_NONFICTION_TEMPLATE = {
 }
 
 
-# Template Registry
-TEMPLATE_REGISTRY: Dict[str, Dict[str, Any]] = {
+# Template Registry (read-only). Keys are lowercase identifier-like literals,
+# which the compiler already interns, so lookups hit the identity fast path.
+TEMPLATE_REGISTRY: Mapping[str, Dict[str, Any]] = MappingProxyType({
     "blog_post": BLOG_POST_TEMPLATE,
     "blog": BLOG_POST_TEMPLATE,  # Alias
     "technical_article": TECHNICAL_ARTICLE_TEMPLATE,
@@ -738,7 +766,7 @@ TEMPLATE_REGISTRY: Dict[str, Dict[str, Any]] = {
     "general_nonfiction": GENERAL_NONFICTION_TEMPLATE,
     "general": GENERAL_NONFICTION_TEMPLATE,  # Alias
     "nonfiction": GENERAL_NONFICTION_TEMPLATE,  # Alias
-}
+})
 
 
 def get_outline_template(document_type: str) -> Optional[Dict[str, Any]]:
@@ -756,7 +784,11 @@ def get_outline_template(document_type: str) -> Optional[Dict[str, Any]]:
         >>> print(template["description"])
         Standard blog post structure with engaging hook and practical content
     """
-    return TEMPLATE_REGISTRY.get(document_type.lower())
+    # Most callers already pass a lowercase name, so try it before lowering
+    template = TEMPLATE_REGISTRY.get(document_type)
+    if template is None:
+        template = TEMPLATE_REGISTRY.get(document_type.lower())
+    return template
 
 
 def list_available_templates() -> List[str]:
@@ -806,10 +838,11 @@ def customize_template(
     import copy
     customized = copy.deepcopy(template)
 
-    # Replace {topic} placeholders in search queries
+    # Replace {topic} placeholders in search queries. {topic} is the only
+    # placeholder, so a plain replace avoids str.format's spec parsing.
     for section in customized["sections"]:
         section["search_queries"] = [
-            query.format(topic=topic) for query in section["search_queries"]
+            query.replace("{topic}", topic) for query in section["search_queries"]
         ]
 
     # Apply custom overrides if provided
@@ -817,6 +850,9 @@ def customize_template(
         if "estimated_total_length" in customizations:
             customized["estimated_total_length"] = customizations["estimated_total_length"]
         if "additional_sections" in customizations:
-            customized["sections"].extend(customizations["additional_sections"])
+            customized["sections"].extend(
+                _intern_section_keys(section)
+                for section in customizations["additional_sections"]
+            )
 
     return customized
@@ -7,13 +7,132 @@ This module provides a unified interface for multiple search providers:
 - Serper (Google results, requires API key)
 """
 
+import functools
+import logging
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
+# orjson parses API responses considerably faster; fall back to stdlib json
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 from src.graph.state import SearchResult
 from src.config.settings import settings
 
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent HTTP requests issued by search_multiple_queries
+MAX_SEARCH_WORKERS = 8
+
+# DuckDuckGo rate-limits aggressively, so cap its concurrent requests
+# separately from MAX_SEARCH_WORKERS
+MAX_DUCKDUCKGO_WORKERS = 2
+_DUCKDUCKGO_SLOTS = threading.BoundedSemaphore(MAX_DUCKDUCKGO_WORKERS)
+
+# Longer queries are truncated before being sent to a provider
+MAX_QUERY_LENGTH = 2048
+
+# Lightweight endpoints used by test_connection instead of a real search
+_HEALTH_CHECK_URLS = {
+    "tavily": "https://api.tavily.com/",
+    "serper": "https://google.serper.dev/",
+}
+_DUCKDUCKGO_HOST = ("duckduckgo.com", 443)
+_HEALTH_CHECK_TIMEOUT = 3
+
+
+@functools.cache
+def _get_requests():
+    """Import the optional requests dependency once; return (requests, HTTPAdapter)."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    return requests, HTTPAdapter
+
+
+# Process-wide HTTP session for Tavily/Serper. Agents create a new
+# SearchProvider on every node run, so a per-provider session would throw
+# its keep-alive pool away after each run and leave the sockets to GC.
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """Return the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                requests, HTTPAdapter = _get_requests()
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=MAX_SEARCH_WORKERS,
+                    pool_maxsize=MAX_SEARCH_WORKERS
+                )
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+@functools.cache
+def _get_ddgs_class():
+    """Import the optional duckduckgo-search dependency once and return DDGS."""
+    from duckduckgo_search import DDGS
+
+    return DDGS
+
+
+# Process-wide LRU cache of recent results. Agents create a new
+# SearchProvider on every node run, so the cache lives at module level to
+# survive across turns. Keys are (provider, api_key, query, max_results).
+_search_cache: "OrderedDict[tuple, tuple[float, tuple[SearchResult, ...]]]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _cache_get(key: tuple) -> Optional[List[SearchResult]]:
+    """Return a copy of fresh cached results for key, or None."""
+    if settings.search_cache_size <= 0:
+        return None
+
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is None:
+            return None
+
+        timestamp, results = entry
+        if time.monotonic() - timestamp >= settings.search_cache_ttl_seconds:
+            del _search_cache[key]
+            return None
+
+        _search_cache.move_to_end(key)
+
+    # Hand out fresh dicts so callers can't mutate the cached entries
+    return [dict(result) for result in results]
+
+
+def _cache_put(key: tuple, results: List[SearchResult]) -> None:
+    """Store a copy of results for key, evicting the least recently used entries."""
+    if settings.search_cache_size <= 0:
+        return
+
+    entry = (time.monotonic(), tuple(dict(result) for result in results))
+    with _search_cache_lock:
+        _search_cache[key] = entry
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > settings.search_cache_size:
+            _search_cache.popitem(last=False)
+
+
 class SearchProvider:
     """
     Unified search interface supporting multiple search backends.
@@ -46,7 +165,17 @@ class SearchProvider:
         self.api_key = api_key or settings.search_api_key
         self.max_results = max_results or settings.max_search_results_per_query
 
+        # Resolve the backend once so search() needs no per-call branching
+        search_backends = {
+            "duckduckgo": self._search_duckduckgo,
+            "tavily": self._search_tavily,
+            "serper": self._search_serper,
+        }
+        self._search_fn = search_backends.get(self.provider_type)
+
         # Validate configuration
+        if self._search_fn is None:
+            raise ValueError(f"Unknown search provider: {self.provider_type}")
         if self.provider_type in ["tavily", "serper"] and not self.api_key:
             raise ValueError(
                 f"{self.provider_type} requires an API key. "
@@ -66,7 +195,7 @@ class SearchProvider:
             max_results: Override default max_results for this query
 
         Returns:
-            List of SearchResult dictionaries
+            List of SearchResult dictionaries (empty for a blank query)
 
         Example:
             >>> provider = SearchProvider()
@@ -74,16 +203,26 @@ class SearchProvider:
             >>> for result in results:
             ...     print(result["title"])
         """
+        # Skip the network round-trip for queries no provider can answer
+        query = query.strip()
+        if not query:
+            return []
+        query = query[:MAX_QUERY_LENGTH]
+
         num_results = max_results or self.max_results
+        cache_key = (self.provider_type, self.api_key, query, num_results)
 
-        if self.provider_type == "duckduckgo":
-            return self._search_duckduckgo(query, num_results)
-        elif self.provider_type == "tavily":
-            return self._search_tavily(query, num_results)
-        elif self.provider_type == "serper":
-            return self._search_serper(query, num_results)
-        else:
-            raise ValueError(f"Unknown search provider: {self.provider_type}")
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        results = self._search_fn(query, num_results)
+
+        # Empty results usually mean a backend error, so don't cache them
+        if results:
+            _cache_put(cache_key, results)
+
+        return results
 
     def _search_duckduckgo(self, query: str, max_results: int) -> List[SearchResult]:
         """
@@ -92,32 +231,32 @@ class SearchProvider:
         This is the default search provider as it requires no authentication.
         """
         try:
-            from duckduckgo_search import DDGS
+            DDGS = _get_ddgs_class()
 
-            results = []
-            with DDGS() as ddgs:
+            # DDGS clients are not safe to share between threads, so each
+            # search gets its own (closed on exit) under the concurrency cap
+            with _DUCKDUCKGO_SLOTS, DDGS() as ddgs:
                 search_results = ddgs.text(query, max_results=max_results)
 
-                for idx, result in enumerate(search_results):
-                    if idx >= max_results:
-                        break
-
-                    search_result = SearchResult(
-                        title=result.get("title", ""),
-                        url=result.get("href", ""),
-                        snippet=result.get("body", ""),
-                        relevance_score=None,  # DuckDuckGo doesn't provide scores
-                        source="duckduckgo"
-                    )
-                    results.append(search_result)
+            # SearchResult is a TypedDict, so build plain dict literals directly
+            results: List[SearchResult] = [
+                {
+                    "title": result.get("title", ""),
+                    "url": result.get("href", ""),
+                    "snippet": result.get("body", ""),
+                    "relevance_score": None,  # DuckDuckGo doesn't provide scores
+                    "source": "duckduckgo",
+                }
+                for result in islice(search_results or (), max_results)
+            ]
 
             return results
 
         except ImportError:
-            print("Warning: duckduckgo-search not installed. Install with: pip install duckduckgo-search")
+            logger.warning("duckduckgo-search not installed. Install with: pip install duckduckgo-search")
             return []
         except Exception as e:
-            print(f"DuckDuckGo search error: {e}")
+            logger.warning("DuckDuckGo search error: %s", e)
             return []
 
     def _search_tavily(self, query: str, max_results: int) -> List[SearchResult]:
@@ -128,7 +267,7 @@ class SearchProvider:
         for LLM applications.
         """
         try:
-            import requests
+            session = _get_session()
 
             url = "https://api.tavily.com/search"
             headers = {"Content-Type": "application/json"}
@@ -141,29 +280,28 @@ class SearchProvider:
                 "include_raw_content": False
             }
 
-            response = requests.post(url, json=payload, headers=headers, timeout=10)
+            response = session.post(url, json=payload, headers=headers, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
-            results = []
-
-            for item in data.get("results", [])[:max_results]:
-                search_result = SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    snippet=item.get("content", ""),
-                    relevance_score=item.get("score"),
-                    source="tavily"
-                )
-                results.append(search_result)
+            data = _json.loads(response.content)
+            results: List[SearchResult] = [
+                {
+                    "title": item.get("title", ""),
+                    "url": item.get("url", ""),
+                    "snippet": item.get("content", ""),
+                    "relevance_score": item.get("score"),
+                    "source": "tavily",
+                }
+                for item in islice(data.get("results") or (), max_results)
+            ]
 
             return results
 
         except ImportError:
-            print("Warning: requests library not installed. Install with: pip install requests")
+            logger.warning("requests library not installed. Install with: pip install requests")
             return []
         except Exception as e:
-            print(f"Tavily search error: {e}")
+            logger.warning("Tavily search error: %s", e)
             return []
 
     def _search_serper(self, query: str, max_results: int) -> List[SearchResult]:
@@ -173,7 +311,7 @@ class SearchProvider:
         Serper provides access to Google search results through an API.
         """
         try:
-            import requests
+            session = _get_session()
 
             url = "https://google.serper.dev/search"
             headers = {
@@ -185,37 +323,40 @@ class SearchProvider:
                 "num": max_results
             }
 
-            response = requests.post(url, json=payload, headers=headers, timeout=10)
+            response = session.post(url, json=payload, headers=headers, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
-            results = []
-
-            for item in data.get("organic", [])[:max_results]:
-                search_result = SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("link", ""),
-                    snippet=item.get("snippet", ""),
-                    relevance_score=None,  # Serper doesn't provide explicit scores
-                    source="serper"
-                )
-                results.append(search_result)
+            data = _json.loads(response.content)
+            results: List[SearchResult] = [
+                {
+                    "title": item.get("title", ""),
+                    "url": item.get("link", ""),
+                    "snippet": item.get("snippet", ""),
+                    "relevance_score": None,  # Serper doesn't provide explicit scores
+                    "source": "serper",
+                }
+                for item in islice(data.get("organic") or (), max_results)
+            ]
 
             return results
 
         except ImportError:
-            print("Warning: requests library not installed. Install with: pip install requests")
+            logger.warning("requests library not installed. Install with: pip install requests")
             return []
         except Exception as e:
-            print(f"Serper search error: {e}")
+            logger.warning("Serper search error: %s", e)
             return []
 
     def test_connection(self) -> bool:
         """
         Test if the search provider is accessible and working.
 
+        Checks reachability without issuing a search, so health checks are
+        fast and don't consume API quota. API keys are not validated here,
+        but a server error from the API host counts as unhealthy.
+
         Returns:
-            True if search works, False otherwise
+            True if the provider is reachable and not failing, False otherwise
 
         Example:
             >>> provider = SearchProvider()
@@ -223,25 +364,37 @@ class SearchProvider:
             ...     print("Search is working!")
         """
         try:
-            results = self.search("test query", max_results=1)
-            return len(results) > 0
+            if self.provider_type == "duckduckgo":
+                _get_ddgs_class()
+                with socket.create_connection(_DUCKDUCKGO_HOST, timeout=_HEALTH_CHECK_TIMEOUT):
+                    return True
+
+            # Client errors (e.g. 404/405 on the bare host) still mean the API
+            # is up; 5xx means the provider is having an outage
+            health_url = _HEALTH_CHECK_URLS[self.provider_type]
+            response = _get_session().head(health_url, timeout=_HEALTH_CHECK_TIMEOUT)
+            return response.status_code < 500
         except Exception as e:
-            print(f"Search connection test failed: {e}")
+            logger.warning("Search connection test failed: %s", e)
             return False
 
 
 def search_multiple_queries(
     queries: List[str],
     provider: Optional[SearchProvider] = None,
-    max_results_per_query: int = 5
+    max_results_per_query: int = 5,
+    deduplicate: bool = False
 ) -> Dict[str, List[SearchResult]]:
     """
-    Execute multiple search queries and organize results.
+    Execute multiple search queries concurrently and organize results.
 
     Args:
         queries: List of search query strings
         provider: SearchProvider instance (creates default if None)
         max_results_per_query: Maximum results per query
+        deduplicate: If True, drop results without a URL or whose URL already
+                     appeared for an earlier query, so the combined results
+                     need no separate deduplicate_results() pass
 
     Returns:
         Dictionary mapping query to list of SearchResults
@@ -256,14 +409,36 @@ def search_multiple_queries(
         provider = SearchProvider(max_results=max_results_per_query)
 
     results_by_query = {}
+    seen_urls = set()
+
+    if not queries:
+        return results_by_query
+
+    # Searches are network-bound, so run them concurrently and collect
+    # the results back in the original query order.
+    with ThreadPoolExecutor(max_workers=min(len(queries), MAX_SEARCH_WORKERS)) as executor:
+        futures = {
+            query: executor.submit(provider.search, query, max_results_per_query)
+            for query in queries
+        }
+
+        for query, future in futures.items():
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.warning("Error searching for '%s': %s", query, e)
+                results = []
+
+            if deduplicate:
+                unique = []
+                for result in results:
+                    url = result.get("url", "")
+                    if url and url not in seen_urls:
+                        seen_urls.add(url)
+                        unique.append(result)
+                results = unique
 
-    for query in queries:
-        try:
-            results = provider.search(query, max_results=max_results_per_query)
             results_by_query[query] = results
-        except Exception as e:
-            print(f"Error searching for '{query}': {e}")
-            results_by_query[query] = []
 
     return results_by_query
 
@@ -289,13 +464,13 @@ def deduplicate_results(
         ...     all_results.extend(r)
         >>> unique_results = deduplicate_results(all_results)
     """
-    seen = set()
-    unique_results = []
+    # Dicts preserve insertion order, so setdefault keeps the first result
+    # seen for each key with a single hash lookup per item.
+    unique_results: Dict[str, SearchResult] = {}
 
     for result in results:
         key = result.get(by, "")
-        if key and key not in seen:
-            seen.add(key)
-            unique_results.append(result)
+        if key:
+            unique_results.setdefault(key, result)
 
-    return unique_results
+    return list(unique_results.values())
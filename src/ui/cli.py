@@ -5,20 +5,67 @@ This module provides an interactive command-line interface with
 beautiful formatting using the Rich library.
 """
 
-from typing import Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
+from rich.prompt import Prompt
+from rich.text import Text
 from rich import box
-from langgraph.types import Command
-from langgraph.errors import GraphInterrupt
 
-from src.graph.workflow import compile_workflow, create_initial_state
 from src.config.settings import settings
+from src.utils import export_complete_book
+
+# LangGraph and the workflow (which pulls in every agent) are imported where
+# they're used, so commands that never run a session don't pay for them.
+if TYPE_CHECKING:
+    from langgraph.errors import GraphInterrupt
+
+
+# Pre-styled panel labels, assembled with event data via Text.assemble so
+# the markup parser doesn't re-tokenize static text on every event.
+_LABEL_DOCUMENT_TYPE = Text("Document Type:", style="bold")
+_LABEL_TARGET_AUDIENCE = Text("Target Audience:", style="bold")
+_LABEL_TONE = Text("Tone:", style="bold")
+_LABEL_OBJECTIVES = Text("Objectives:", style="bold")
+_LABEL_SECTIONS_RESEARCHED = Text("Sections Researched:", style="bold")
+_LABEL_TOTAL_SOURCES = Text("Total Sources:", style="bold")
+_LABEL_TITLE = Text("Title:", style="bold")
+_LABEL_TYPE = Text("Type:", style="bold")
+_LABEL_CHAPTERS = Text("Chapters:", style="bold")
+_LABEL_LANGUAGE = Text("Language:", style="bold")
+
+
+@lru_cache(maxsize=None)
+def _build_banner(mode: str, model: str, url: str) -> Panel:
+    """
+    Build the welcome banner panel.
+
+    Rich renderables are immutable, so the parsed Markdown panel is cached
+    and reused for every session start with the same settings.
+    """
+    banner_text = """
+# Writer-Editor Review Loop System
+
+**Mode**: {mode}
+**LLM**: {model} @ {url}
+
+Ready to create high-quality content!
+    """.format(
+        mode=mode.upper(),
+        model=model,
+        url=url
+    )
+
+    return Panel(
+        Markdown(banner_text),
+        border_style="blue",
+        box=box.DOUBLE
+    )
 
 
 class CLI:
@@ -29,6 +76,22 @@ class CLI:
     with beautiful terminal output using Rich.
     """
 
+    __slots__ = (
+        "console",
+        "mode",
+        "_app",
+        "_banner",
+        "_last_feedback",
+        "_last_feedback_panel",
+    )
+
+    # Decision prompts: kind -> (title, {shortcut: decision}, default)
+    _DECISIONS = {
+        "outline": ("Outline Decision", {"p": "proceed", "r": "revise"}, "proceed"),
+        "draft": ("Draft Decision", {"c": "continue", "s": "stop"}, "stop"),
+        "chapter": ("Chapter Review", {"a": "approve", "r": "revise", "s": "stop"}, "approve"),
+    }
+
     def __init__(self, mode: str = "multi-agent"):
         """
         Initialize the CLI.
@@ -36,30 +99,33 @@ class CLI:
         Args:
             mode: Workflow mode ('simple' or 'multi-agent')
         """
-        self.console = Console()
+        # Output is mostly prose panels with explicit [bold] markup, so skip
+        # Rich's regex-based repr highlighting and emoji code replacement.
+        self.console = Console(highlight=False, emoji=False, log_time=False, log_path=False)
         self.mode = mode
-        self.app = compile_workflow(mode)
+        self._app = None
+        self._banner = _build_banner(
+            mode,
+            settings.lm_studio_model,
+            settings.lm_studio_base_url
+        )
 
-    def print_banner(self):
-        """Display welcome banner."""
-        banner_text = """
-# Writer-Editor Review Loop System
+        # Last feedback panel, reused when a revision loop repeats the feedback
+        self._last_feedback: Optional[str] = None
+        self._last_feedback_panel: Optional[Panel] = None
 
-**Mode**: {mode}
-**LLM**: {model} @ {url}
+    @property
+    def app(self):
+        """Compiled workflow graph, built on first use."""
+        if self._app is None:
+            from src.graph.workflow import compile_workflow
 
-Ready to create high-quality content!
-        """.format(
-            mode=self.mode.upper(),
-            model=settings.lm_studio_model,
-            url=settings.lm_studio_base_url
-        )
+            self._app = compile_workflow(self.mode)
+        return self._app
 
-        self.console.print(Panel(
-            Markdown(banner_text),
-            border_style="blue",
-            box=box.DOUBLE
-        ))
+    def print_banner(self):
+        """Display welcome banner."""
+        self.console.print(self._banner)
 
     def start_session(
         self,
@@ -77,6 +143,9 @@ Ready to create high-quality content!
             max_iterations: Override default max iterations
             max_outline_revisions: Override default max outline revisions
         """
+        from langgraph.errors import GraphInterrupt
+        from src.graph.workflow import create_initial_state
+
         self.print_banner()
 
         # Get topic if not provided
@@ -85,7 +154,7 @@ Ready to create high-quality content!
 
         # Generate or use provided thread_id
         if not thread_id:
-            thread_id = str(uuid4())
+            thread_id = uuid4().hex
             self.console.print(f"\n[dim]Session ID: {thread_id}[/dim]")
 
         # Create initial state
@@ -123,52 +192,55 @@ Ready to create high-quality content!
         Args:
             event: Event dictionary from workflow stream
         """
-        stage = event.get("current_stage", "")
-
-        if stage == "intent_analysis_complete":
-            self._display_intent_analysis(event)
-        elif stage == "outline_created":
-            self._display_outline(event)
-        elif stage == "outline_reviewed":
-            self._display_outline_review(event)
-        elif stage == "research_complete":
-            self._display_research_summary(event)
-        elif stage == "draft_created":
-            self._display_draft(event)
-        elif stage == "draft_reviewed":
-            self._display_feedback(event)
-
-    def _handle_interrupt(self, interrupt_event: GraphInterrupt, config: dict, thread_id: str):
+        handler = self._EVENT_HANDLERS.get(event.get("current_stage", ""))
+        if handler:
+            # Buffer everything printed for this event into a single write
+            with self.console:
+                handler(self, event)
+
+    def _handle_interrupt(self, interrupt_event: "GraphInterrupt", config: dict, thread_id: str):
         """
-        Handle user intervention interrupt.
+        Handle user intervention interrupts until the workflow completes.
+
+        Each further interrupt is handled in the same loop rather than by
+        recursion, so long sessions don't grow the call stack.
 
         Args:
             interrupt_event: The GraphInterrupt exception
             config: Workflow configuration
             thread_id: Session thread ID
         """
-        # Get user input
-        stage = interrupt_event.args[0] if interrupt_event.args else "unknown"
+        from langgraph.errors import GraphInterrupt
+        from langgraph.types import Command
 
-        if "outline" in stage.lower():
-            user_input = self._get_outline_decision()
-        else:
-            user_input = self._get_draft_decision()
+        pending = interrupt_event
 
-        # Resume workflow with user input
-        try:
-            for event in self.app.stream(Command(resume=user_input), config, stream_mode="values"):
-                self._handle_event(event)
+        while True:
+            # Get user input
+            stage = pending.args[0] if pending.args else "unknown"
+            is_outline = "outline" in stage.casefold()
 
-            self.console.print("\n[bold green]✓ Workflow completed![/bold green]")
+            if is_outline:
+                user_input = self._get_outline_decision()
+            else:
+                user_input = self._get_draft_decision()
 
-        except GraphInterrupt as gi:
-            # Another intervention point
-            self._handle_interrupt(gi, config, thread_id)
+            # Resume workflow with user input
+            try:
+                for event in self.app.stream(Command(resume=user_input), config, stream_mode="values"):
+                    self._handle_event(event)
 
-        except Exception as e:
-            self.console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
-            raise
+            except GraphInterrupt as gi:
+                # Another intervention point
+                pending = gi
+                continue
+
+            except Exception as e:
+                self.console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
+                raise
+
+            self.console.print("\n[bold green]✓ Workflow completed![/bold green]")
+            return
 
     def _display_intent_analysis(self, event: dict):
         """Display user intent analysis."""
@@ -177,10 +249,12 @@ Ready to create high-quality content!
             return
 
         self.console.print(Panel(
-            f"""[bold]Document Type:[/bold] {intent['document_type']}
-[bold]Target Audience:[/bold] {intent['target_audience']}
-[bold]Tone:[/bold] {intent['tone']}
-[bold]Objectives:[/bold] {', '.join(intent['objectives'])}""",
+            Text.assemble(
+                _LABEL_DOCUMENT_TYPE, f" {intent['document_type']}\n",
+                _LABEL_TARGET_AUDIENCE, f" {intent['target_audience']}\n",
+                _LABEL_TONE, f" {intent['tone']}\n",
+                _LABEL_OBJECTIVES, f" {', '.join(intent['objectives'])}"
+            ),
             title="[bold cyan]Intent Analysis[/bold cyan]",
             border_style="cyan"
         ))
@@ -191,10 +265,10 @@ Ready to create high-quality content!
         if not outline:
             return
 
-        sections_text = ""
-        for idx, section in enumerate(outline["sections"], 1):
-            sections_text += f"\n{idx}. [bold]{section['title']}[/bold]\n"
-            sections_text += f"   {section['purpose']}\n"
+        sections_text = "".join(
+            f"\n{idx}. [bold]{section['title']}[/bold]\n   {section['purpose']}\n"
+            for idx, section in enumerate(outline["sections"], 1)
+        )
 
         self.console.print(Panel(
             f"""[bold]Structure:[/bold] {outline['overall_structure']}
@@ -239,13 +313,14 @@ Ready to create high-quality content!
             self.console.print("[dim]No research performed[/dim]")
             return
 
-        total_sources = sum(len(r["sources"]) for r in research_by_section.values())
+        total_sources = sum(map(len, map(itemgetter("sources"), research_by_section.values())))
 
         self.console.print(Panel(
-            f"""[bold]Sections Researched:[/bold] {len(research_by_section)}
-[bold]Total Sources:[/bold] {total_sources}
-
-Research data ready for writing.""",
+            Text.assemble(
+                _LABEL_SECTIONS_RESEARCHED, f" {len(research_by_section)}\n",
+                _LABEL_TOTAL_SOURCES, f" {total_sources}\n",
+                "\nResearch data ready for writing."
+            ),
             title="[bold green]Research Complete[/bold green]",
             border_style="green"
         ))
@@ -256,7 +331,8 @@ Research data ready for writing.""",
         iteration = event.get("iteration_count", 0)
 
         # Show preview (first 500 chars)
-        preview = draft[:500] + "..." if len(draft) > 500 else draft
+        draft_length = len(draft)
+        preview = f"{draft[:500]}..." if draft_length > 500 else draft
 
         self.console.print(Panel(
             preview,
@@ -264,35 +340,52 @@ Research data ready for writing.""",
             border_style="blue"
         ))
 
-        self.console.print(f"[dim]Full length: {len(draft)} characters[/dim]\n")
+        self.console.print(f"[dim]Full length: {draft_length} characters[/dim]\n")
 
     def _display_feedback(self, event: dict):
         """Display editor feedback."""
         feedback = event.get("current_feedback", "")
 
-        self.console.print(Panel(
-            feedback,
-            title="[bold yellow]Editor Feedback[/bold yellow]",
-            border_style="yellow"
-        ))
+        if feedback != self._last_feedback:
+            self._last_feedback = feedback
+            self._last_feedback_panel = Panel(
+                feedback,
+                title="[bold yellow]Editor Feedback[/bold yellow]",
+                border_style="yellow"
+            )
 
-    def _get_outline_decision(self) -> str:
+        self.console.print(self._last_feedback_panel)
+
+    def _prompt_decision(self, kind: str) -> str:
         """
-        Get user decision on outline.
+        Ask the user for a decision, accepting a one-letter shortcut.
+
+        Args:
+            kind: Decision type ('outline', 'draft', or 'chapter')
 
         Returns:
-            User decision: 'proceed' or 'revise'
+            The full decision word
         """
-        self.console.print("\n[bold]Outline Decision[/bold]")
+        title, shortcuts, default = self._DECISIONS[kind]
+        self.console.print(f"\n[bold]{title}[/bold]")
 
-        choices = ["proceed", "revise"]
-        decision = Prompt.ask(
+        answer = Prompt.ask(
             "What would you like to do?",
-            choices=choices,
-            default="proceed"
+            console=self.console,
+            choices=[*shortcuts.values(), *shortcuts],
+            default=default
         )
 
-        return decision
+        return shortcuts.get(answer, answer)
+
+    def _get_outline_decision(self) -> str:
+        """
+        Get user decision on outline.
+
+        Returns:
+            User decision: 'proceed' or 'revise'
+        """
+        return self._prompt_decision("outline")
 
     def _get_draft_decision(self) -> str:
         """
@@ -301,16 +394,7 @@ Research data ready for writing.""",
         Returns:
             User decision: 'continue' or 'stop'
         """
-        self.console.print("\n[bold]Draft Decision[/bold]")
-
-        choices = ["continue", "stop"]
-        decision = Prompt.ask(
-            "What would you like to do?",
-            choices=choices,
-            default="stop"
-        )
-
-        return decision
+        return self._prompt_decision("draft")
 
     def start_book_session(
         self,
@@ -332,11 +416,14 @@ Research data ready for writing.""",
             max_iterations: Override default max iterations
             max_outline_revisions: Override default max outline revisions
         """
+        from langgraph.errors import GraphInterrupt
+        from src.graph.workflow import create_initial_state
+
         self.print_banner()
 
         # Generate or use provided thread_id
         if not thread_id:
-            thread_id = str(uuid4())
+            thread_id = uuid4().hex
             self.console.print(f"\n[dim]Session ID: {thread_id}[/dim]")
 
         # Create initial state for book
@@ -381,47 +468,49 @@ Research data ready for writing.""",
         Args:
             event: Event dictionary from workflow stream
         """
-        stage = event.get("current_stage", "")
-        chapter_number = event.get("chapter_number", 0)
-
-        if stage == "planning":
-            self._display_book_planning(event)
-        elif stage == "writing_chapter":
-            self.console.print(f"\n[bold blue]Writing Chapter {chapter_number}...[/bold blue]")
-        elif stage == "draft_created":
-            self._display_chapter_draft(event)
-        elif stage == "draft_reviewed":
-            self._display_feedback(event)
+        handler = self._BOOK_EVENT_HANDLERS.get(event.get("current_stage", ""))
+        if handler:
+            # Buffer everything printed for this event into a single write
+            with self.console:
+                handler(self, event)
 
-    def _handle_book_interrupt(self, interrupt_event: GraphInterrupt, config: dict, thread_id: str):
+    def _handle_book_interrupt(self, interrupt_event: "GraphInterrupt", config: dict, thread_id: str):
         """
-        Handle chapter review intervention.
+        Handle chapter review interventions until the book completes.
+
+        Each further interrupt is handled in the same loop rather than by
+        recursion, so long books don't grow the call stack.
 
         Args:
             interrupt_event: The GraphInterrupt exception
             config: Workflow configuration
             thread_id: Session thread ID
         """
-        # Get user decision on chapter
-        user_input = self._get_chapter_decision()
+        from langgraph.errors import GraphInterrupt
+        from langgraph.types import Command
 
-        # Resume workflow with user input
-        try:
-            for event in self.app.stream(Command(resume=user_input), config, stream_mode="values"):
-                self._handle_book_event(event)
+        while True:
+            # Get user decision on chapter
+            user_input = self._get_chapter_decision()
 
-            # Export book when complete
-            self._export_book(event)
+            # Resume workflow with user input
+            try:
+                for event in self.app.stream(Command(resume=user_input), config, stream_mode="values"):
+                    self._handle_book_event(event)
 
-            self.console.print("\n[bold green]✓ Book completed![/bold green]")
+                # Export book when complete
+                self._export_book(event)
 
-        except GraphInterrupt as gi:
-            # Another chapter intervention
-            self._handle_book_interrupt(gi, config, thread_id)
+            except GraphInterrupt:
+                # Another chapter intervention
+                continue
 
-        except Exception as e:
-            self.console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
-            raise
+            except Exception as e:
+                self.console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
+                raise
+
+            self.console.print("\n[bold green]✓ Book completed![/bold green]")
+            return
 
     def _display_book_planning(self, event: dict):
         """Display book planning results."""
@@ -430,24 +519,28 @@ Research data ready for writing.""",
 
         if book_metadata:
             self.console.print(Panel(
-                f"""[bold]Title:[/bold] {book_metadata.get('book_title', 'Untitled')}
-[bold]Type:[/bold] {book_metadata.get('book_type', 'general')}
-[bold]Chapters:[/bold] {book_metadata.get('estimated_chapters', 0)}
-[bold]Language:[/bold] {book_metadata.get('language', 'en')}""",
+                Text.assemble(
+                    _LABEL_TITLE, f" {book_metadata.get('book_title', 'Untitled')}\n",
+                    _LABEL_TYPE, f" {book_metadata.get('book_type', 'general')}\n",
+                    _LABEL_CHAPTERS, f" {book_metadata.get('estimated_chapters', 0)}\n",
+                    _LABEL_LANGUAGE, f" {book_metadata.get('language', 'en')}"
+                ),
                 title="[bold cyan]Book Planning Complete[/bold cyan]",
                 border_style="cyan"
             ))
 
         if toc:
-            chapters_text = ""
-            for chapter in toc.get("chapters", [])[:5]:  # Show first 5
-                num = chapter.get('number', 0)
-                title = chapter.get('title', '')
-                chapters_text += f"\n{num}. {title}"
+            chapters = toc.get("chapters", [])
+            lines = [
+                f"\n{chapter.get('number', 0)}. {chapter.get('title', '')}"
+                for chapter in chapters[:5]  # Show first 5
+            ]
 
-            total = len(toc.get("chapters", []))
+            total = len(chapters)
             if total > 5:
-                chapters_text += f"\n... and {total - 5} more chapters"
+                lines.append(f"\n... and {total - 5} more chapters")
+
+            chapters_text = "".join(lines)
 
             self.console.print(Panel(
                 chapters_text,
@@ -455,13 +548,19 @@ Research data ready for writing.""",
                 border_style="green"
             ))
 
+    def _display_chapter_start(self, event: dict):
+        """Display the chapter currently being written."""
+        chapter_number = event.get("chapter_number", 0)
+        self.console.print(f"\n[bold blue]Writing Chapter {chapter_number}...[/bold blue]")
+
     def _display_chapter_draft(self, event: dict):
         """Display chapter draft."""
         draft = event.get("current_draft", "")
         chapter_num = event.get("chapter_number", 0)
 
         # Show preview
-        preview = draft[:500] + "..." if len(draft) > 500 else draft
+        draft_length = len(draft)
+        preview = f"{draft[:500]}..." if draft_length > 500 else draft
 
         self.console.print(Panel(
             preview,
@@ -469,7 +568,7 @@ Research data ready for writing.""",
             border_style="blue"
         ))
 
-        self.console.print(f"[dim]Full length: {len(draft)} characters[/dim]\n")
+        self.console.print(f"[dim]Full length: {draft_length} characters[/dim]\n")
 
     def _get_chapter_decision(self) -> str:
         """
@@ -478,21 +577,10 @@ Research data ready for writing.""",
         Returns:
             User decision: 'approve', 'revise', or 'stop'
         """
-        self.console.print("\n[bold]Chapter Review[/bold]")
-
-        choices = ["approve", "revise", "stop"]
-        decision = Prompt.ask(
-            "What would you like to do?",
-            choices=choices,
-            default="approve"
-        )
-
-        return decision
+        return self._prompt_decision("chapter")
 
     def _export_book(self, final_state: dict):
         """Export completed book."""
-        from src.utils import export_complete_book
-
         book_metadata = final_state.get("book_metadata")
         if not book_metadata:
             return
@@ -500,7 +588,10 @@ Research data ready for writing.""",
         self.console.print("\n[bold cyan]Exporting book...[/bold cyan]")
 
         try:
-            paths = export_complete_book(final_state)
+            # Pandoc PDF generation can take a while; animate a spinner on
+            # Rich's refresh thread so the CLI doesn't look frozen.
+            with self.console.status("[cyan]Writing markdown and PDF...[/cyan]"):
+                paths = export_complete_book(final_state)
 
             if paths['markdown']:
                 self.console.print(f"[bold green]✓ Markdown:[/bold green] {paths['markdown']}")
@@ -529,3 +620,22 @@ Research data ready for writing.""",
         """List all available sessions."""
         # This would query the checkpoint database
         self.console.print("[yellow]Session listing not yet implemented[/yellow]")
+
+    # Workflow stage -> display function for each event stream. Built from
+    # the functions themselves at class creation, so dispatching an event
+    # is a single dict lookup with no per-event attribute resolution.
+    _EVENT_HANDLERS = {
+        "intent_analysis_complete": _display_intent_analysis,
+        "outline_created": _display_outline,
+        "outline_reviewed": _display_outline_review,
+        "research_complete": _display_research_summary,
+        "draft_created": _display_draft,
+        "draft_reviewed": _display_feedback,
+    }
+
+    _BOOK_EVENT_HANDLERS = {
+        "planning": _display_book_planning,
+        "writing_chapter": _display_chapter_start,
+        "draft_created": _display_chapter_draft,
+        "draft_reviewed": _display_feedback,
+    }
@@ -5,9 +5,58 @@ Provides syntax validation, code quality checks, and beginner-friendly error rep
 """
 
 import ast
+import re
+from functools import lru_cache
 from typing import Tuple, List, Dict, Any, Optional
 
 
+# A markdown fence line: optional indentation, ``` and an optional info string
+_CODE_FENCE_RE = re.compile(r"^[^\S\n]*```.*$", re.MULTILINE)
+
+# Characters the Python tokenizer treats as blank. str.strip() without
+# arguments also removes Unicode spaces, which ast.parse rejects.
+_PYTHON_WHITESPACE = " \t\n\r\f"
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(code: str) -> Tuple[bool, Optional[str]]:
+    """
+    Parse code and return (is_valid, error_message), memoized by content.
+
+    Tutorials repeat identical snippets (imports, setup code) across
+    chapters, so identical blocks skip the parser after the first time.
+    Only the immutable result tuple is cached, never the AST.
+    """
+    try:
+        ast.parse(code)
+        return True, None
+    except SyntaxError as e:
+        error_msg = f"Syntax error on line {e.lineno}: {e.msg}"
+        if e.text:
+            error_msg += f"\n  {e.text.strip()}"
+            if e.offset:
+                error_msg += f"\n  {' ' * (e.offset - 1)}^"
+        return False, error_msg
+    except Exception as e:
+        return False, f"Unexpected error: {str(e)}"
+
+
+def _first_line_starting_with(code: str, char: str) -> Optional[int]:
+    """
+    Return the 1-based number of the first line starting with char, or None.
+
+    Uses str.find/str.count so the scan runs in C instead of a per-line loop.
+    """
+    if code.startswith(char):
+        return 1
+
+    pos = code.find('\n' + char)
+    if pos == -1:
+        return None
+
+    return code.count('\n', 0, pos) + 2
+
+
 class PythonCodeValidator:
     """
     Validates Python code for syntax correctness and quality.
@@ -37,18 +86,11 @@ class PythonCodeValidator:
             >>> assert is_valid is False
             >>> assert "SyntaxError" in error
         """
-        try:
-            ast.parse(code)
+        # Blank blocks are valid; skip the parser (and the cache) for them
+        if not code.strip(_PYTHON_WHITESPACE):
             return True, None
-        except SyntaxError as e:
-            error_msg = f"Syntax error on line {e.lineno}: {e.msg}"
-            if e.text:
-                error_msg += f"\n  {e.text.strip()}"
-                if e.offset:
-                    error_msg += f"\n  {' ' * (e.offset - 1)}^"
-            return False, error_msg
-        except Exception as e:
-            return False, f"Unexpected error: {str(e)}"
+
+        return _parse_cached(code)
 
     @staticmethod
     def check_line_length(code: str, max_length: int = 79) -> List[str]:
@@ -67,14 +109,19 @@ class PythonCodeValidator:
             >>> warnings = PythonCodeValidator.check_line_length(code)
             >>> assert len(warnings) == 1
         """
-        warnings = []
         lines = code.split('\n')
-        for i, line in enumerate(lines, start=1):
-            if len(line) > max_length:
-                warnings.append(
-                    f"Line {i} exceeds {max_length} characters ({len(line)} chars): {line[:50]}..."
-                )
-        return warnings
+
+        # Measure every line in C via map(len); most snippets have no long
+        # lines, so the Python-level loop below only runs when one exists.
+        lengths = list(map(len, lines))
+        if max(lengths) <= max_length:
+            return []
+
+        return [
+            f"Line {i} exceeds {max_length} characters ({length} chars): {line[:50]}..."
+            for i, (line, length) in enumerate(zip(lines, lengths), start=1)
+            if length > max_length
+        ]
 
     @staticmethod
     def check_indentation_consistency(code: str) -> Tuple[bool, Optional[str]]:
@@ -92,21 +139,20 @@ class PythonCodeValidator:
             >>> is_consistent, warning = PythonCodeValidator.check_indentation_consistency(code)
             >>> assert is_consistent is False
         """
-        lines = code.split('\n')
-        has_spaces = False
-        has_tabs = False
+        # Almost all tutorial code is space-indented; one memchr settles it
+        if '\t' not in code:
+            return True, None
 
-        for i, line in enumerate(lines, start=1):
-            if line and line[0] in (' ', '\t'):
-                if line[0] == ' ':
-                    has_spaces = True
-                elif line[0] == '\t':
-                    has_tabs = True
+        space_line = _first_line_starting_with(code, ' ')
+        if space_line is None:
+            return True, None
 
-                if has_spaces and has_tabs:
-                    return False, f"Mixed spaces and tabs detected (problematic around line {i})"
+        tab_line = _first_line_starting_with(code, '\t')
+        if tab_line is None:
+            return True, None
 
-        return True, None
+        # Mixing is first detectable on whichever style appears later
+        return False, f"Mixed spaces and tabs detected (problematic around line {max(space_line, tab_line)})"
 
     @staticmethod
     def extract_code_blocks(text: str) -> List[str]:
@@ -125,27 +171,28 @@ class PythonCodeValidator:
             >>> assert len(blocks) == 1
             >>> assert blocks[0] == "print('hello')"
         """
+        # Prose-only text has no fence at all; one substring scan settles it
+        if '```' not in text:
+            return []
+
         code_blocks = []
-        in_code_block = False
-        current_block = []
-
-        for line in text.split('\n'):
-            if line.strip().startswith('```python') or line.strip().startswith('```'):
-                if in_code_block:
-                    # End of code block
-                    if current_block:
-                        code_blocks.append('\n'.join(current_block))
-                        current_block = []
-                    in_code_block = False
-                else:
-                    # Start of code block
-                    in_code_block = True
-            elif in_code_block:
-                current_block.append(line)
+        block_start = None
+
+        # Fence lines alternate between opening and closing a block
+        for fence in _CODE_FENCE_RE.finditer(text):
+            if block_start is None:
+                # Start of code block (content begins after the fence's newline)
+                block_start = fence.end() + 1
+            else:
+                # End of code block (content ends before the fence's newline)
+                block_end = fence.start() - 1
+                if block_end >= block_start:
+                    code_blocks.append(text[block_start:block_end])
+                block_start = None
 
         # Handle unclosed code block
-        if current_block:
-            code_blocks.append('\n'.join(current_block))
+        if block_start is not None and block_start <= len(text):
+            code_blocks.append(text[block_start:])
 
         return code_blocks
 
@@ -260,8 +307,18 @@ class PythonCodeValidator:
             "blocks": []
         }
 
+        # Blocks are validated serially: tutorial snippets parse in well under
+        # a millisecond, far less than shipping them to worker processes.
+        # Repeated snippets (imports, setup code) are validated only once.
+        validated: Dict[str, Dict[str, Any]] = {}
         for i, code in enumerate(code_blocks, start=1):
-            validation = cls.validate_tutorial_code(code)
+            if code not in validated:
+                validated[code] = cls.validate_tutorial_code(code)
+
+            # Copy the report (and its warning list) so duplicate blocks
+            # never share mutable state and each carries its own block_number
+            report = validated[code]
+            validation = {**report, "line_length_warnings": list(report["line_length_warnings"])}
             validation["block_number"] = i
             results["blocks"].append(validation)
 
@@ -9,14 +9,65 @@ This module handles:
 - Bibliography/glossary generation
 """
 
+import io
 import os
+import shutil
 import subprocess
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Set
+from datetime import datetime, timedelta
 from ..config.settings import settings
 
 
+# Separator written between book sections (the book is assembled as bytes)
+PAGE_BREAK = b"\n\\pagebreak\n\n"
+
+# Buffer size used when copying chapter files into the assembled book
+COPY_BUFFER_SIZE = 1 << 20
+
+# Characters that are invalid in filenames, mapped to '_'
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+
+@lru_cache(maxsize=256)
+def _sanitize_filename(filename: str) -> str:
+    """
+    Sanitize filename for filesystem.
+
+    Cached because the same book title is sanitized for every chapter.
+    """
+    # Replace invalid characters and limit length
+    return filename.translate(_SANITIZE_TABLE)[:100].strip()
+
+
+@lru_cache(maxsize=4)
+def _check_pandoc_available(pandoc_cmd: str) -> bool:
+    """
+    Check if pandoc is available.
+
+    Cached per command because pandoc does not appear or disappear while
+    the process is running, and every PDF export would otherwise probe it.
+    """
+    # Resolve the executable first so a missing pandoc (the common case
+    # without a TeX setup) does not cost a process spawn
+    if shutil.which(pandoc_cmd) is None:
+        return False
+
+    try:
+        result = subprocess.run(
+            [pandoc_cmd, "--version"],
+            capture_output=True,
+            timeout=5
+        )
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+        return False
+
+
 class ExportManager:
     """
     Manages export of chapters and complete books to various formats.
@@ -34,6 +85,24 @@ class ExportManager:
         self.output_dir = Path(output_dir or settings.book_output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Book directories already created by this instance
+        self._created_dirs: Set[Path] = set()
+
+        # Formatted current date, refreshed when the local date changes
+        self._today_str = ""
+        self._today_expires = 0.0
+
+    @property
+    def _today(self) -> str:
+        """Current local date as YYYY-MM-DD, reformatted only when the date changes."""
+        now = time.time()
+        if now >= self._today_expires:
+            today = datetime.fromtimestamp(now)
+            tomorrow = datetime.combine(today.date() + timedelta(days=1), datetime.min.time())
+            self._today_str = today.strftime('%Y-%m-%d')
+            self._today_expires = tomorrow.timestamp()
+        return self._today_str
+
     def export_chapter(
         self,
         chapter_number: int,
@@ -60,9 +129,7 @@ class ExportManager:
             Path to exported chapter file
         """
         # Create book directory
-        book_title = book_metadata.get('book_title', 'Untitled Book')
-        book_dir = self.output_dir / self._sanitize_filename(book_title)
-        book_dir.mkdir(parents=True, exist_ok=True)
+        book_dir = self._book_dir(book_metadata)
 
         # Create chapter filename
         chapter_filename = f"chapter_{chapter_number:02d}.md"
@@ -78,12 +145,33 @@ class ExportManager:
             bibliography
         )
 
-        # Write to file
-        with open(chapter_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Write to file, encoding once and writing the bytes in a single call
+        with open(chapter_path, 'wb') as f:
+            f.write(content.encode('utf-8'))
 
         return str(chapter_path)
 
+    def export_chapters_batch(self, chapter_specs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Export several chapters concurrently.
+
+        Args:
+            chapter_specs: List of keyword-argument dicts for export_chapter
+
+        Returns:
+            Paths to the exported chapter files, in the same order as chapter_specs
+        """
+        if not chapter_specs:
+            return []
+
+        # Create each book directory once up front so workers never race on mkdir
+        for spec in chapter_specs:
+            self._book_dir(spec['book_metadata'])
+
+        max_workers = min(len(chapter_specs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda spec: self.export_chapter(**spec), chapter_specs))
+
     def export_book(
         self,
         book_metadata: Dict[str, Any],
@@ -107,48 +195,39 @@ class ExportManager:
         Returns:
             Path to assembled book file
         """
-        book_title = book_metadata.get('book_title', 'Untitled Book')
-        book_dir = self.output_dir / self._sanitize_filename(book_title)
-        book_dir.mkdir(parents=True, exist_ok=True)
+        book_dir = self._book_dir(book_metadata)
 
         # Create book filename
         book_filename = "complete_book.md"
         book_path = book_dir / book_filename
 
-        # Build complete book content
-        content = []
-
-        # Title page
-        content.append(self._build_title_page(book_metadata))
-        content.append("\n\\pagebreak\n\n")
-
-        # Table of contents
-        content.append(self._build_table_of_contents(table_of_contents))
-        content.append("\n\\pagebreak\n\n")
-
-        # Chapters
-        sorted_chapters = sorted(chapter_export_paths.items())
-        for chapter_num, chapter_path in sorted_chapters:
-            if os.path.exists(chapter_path):
-                with open(chapter_path, 'r', encoding='utf-8') as f:
-                    chapter_content = f.read()
-                    content.append(chapter_content)
-                    content.append("\n\\pagebreak\n\n")
-
-        # Appendices
-        content.append(self._build_glossary(terminology_glossary))
-        content.append("\n\\pagebreak\n\n")
-
-        if fact_check_results:
-            content.append(self._build_fact_check_appendix(fact_check_results))
-            content.append("\n\\pagebreak\n\n")
-
-        # Combine all content
-        full_content = "".join(content)
-
-        # Write to file
-        with open(book_path, 'w', encoding='utf-8') as f:
-            f.write(full_content)
+        # Stream the book to disk section by section. Chapter files are
+        # already UTF-8 markdown, so they are copied as raw bytes without a
+        # decode/encode round trip; only generated sections are encoded.
+        with open(book_path, 'wb') as out:
+            # Title page
+            out.write(self._build_title_page(book_metadata).encode('utf-8'))
+            out.write(PAGE_BREAK)
+
+            # Table of contents
+            out.write(self._build_table_of_contents(table_of_contents).encode('utf-8'))
+            out.write(PAGE_BREAK)
+
+            # Chapters
+            sorted_chapters = sorted(chapter_export_paths.items())
+            for chapter_num, chapter_path in sorted_chapters:
+                if os.path.exists(chapter_path):
+                    with open(chapter_path, 'rb') as f:
+                        shutil.copyfileobj(f, out, COPY_BUFFER_SIZE)
+                    out.write(PAGE_BREAK)
+
+            # Appendices
+            out.write(self._build_glossary(terminology_glossary).encode('utf-8'))
+            out.write(PAGE_BREAK)
+
+            if fact_check_results:
+                out.write(self._build_fact_check_appendix(fact_check_results).encode('utf-8'))
+                out.write(PAGE_BREAK)
 
         return str(book_path)
 
@@ -188,18 +267,30 @@ class ExportManager:
             "-V", "geometry:margin=1in",
             "-V", f"title={book_metadata.get('book_title', 'Untitled')}",
             "-V", f"author={book_metadata.get('author', 'Unknown Author')}",
-            "-V", f"date={datetime.now().strftime('%Y-%m-%d')}",
+            "-V", f"date={self._today}",
             "--toc",  # Table of contents
             "--toc-depth=2",
             "--number-sections",
-            "--highlight-style=tango"
+            "--highlight-style=tango",
+            "--quiet",
+            # Keep xelatex's terminal output to a minimum (pandoc already
+            # passes -halt-on-error to the engine)
+            "--pdf-engine-opt=-interaction=batchmode"
         ]
 
+        # Keep TeX's font and format caches in a persistent directory so
+        # they are reused across exports
+        env = os.environ.copy()
+        env.setdefault("TEXMFCACHE", str(self.output_dir.resolve() / ".texcache"))
+
+        # One pandoc process per book. `pandoc server` would avoid the startup
+        # cost, but it does not produce PDF output (that needs a LaTeX run).
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
+                env=env,
                 timeout=300  # 5 minute timeout
             )
 
@@ -228,40 +319,40 @@ class ExportManager:
         bibliography: Optional[str]
     ) -> str:
         """Build complete chapter content with all elements."""
-        content = []
+        buf = io.StringIO()
 
         # Chapter header
         chapter_title = chapter_metadata.get('title', f'Chapter {chapter_number}') if chapter_metadata else f'Chapter {chapter_number}'
-        content.append(f"# Chapter {chapter_number}: {chapter_title}\n\n")
+        buf.write(f"# Chapter {chapter_number}: {chapter_title}\n\n")
 
         # Main content
-        content.append(main_content)
-        content.append("\n\n")
+        buf.write(main_content)
+        buf.write("\n\n")
 
         # Formulas index (if any)
         if formulas:
-            content.append("## Formulas\n\n")
+            buf.write("## Formulas\n\n")
             for formula in formulas:
                 formula_id = formula.get('formula_id', '')
                 description = formula.get('description', '')
-                content.append(f"- **{formula_id}**: {description}\n")
-            content.append("\n")
+                buf.write(f"- **{formula_id}**: {description}\n")
+            buf.write("\n")
 
         # Diagrams index (if any)
         if diagrams:
-            content.append("## Diagrams\n\n")
+            buf.write("## Diagrams\n\n")
             for diagram in diagrams:
                 diagram_id = diagram.get('diagram_id', '')
                 caption = diagram.get('caption', '')
-                content.append(f"- **{diagram_id}**: {caption}\n")
-            content.append("\n")
+                buf.write(f"- **{diagram_id}**: {caption}\n")
+            buf.write("\n")
 
         # Bibliography (if any)
         if bibliography:
-            content.append(bibliography)
-            content.append("\n")
+            buf.write(bibliography)
+            buf.write("\n")
 
-        return "".join(content)
+        return buf.getvalue()
 
     def _build_title_page(self, book_metadata: Dict[str, Any]) -> str:
         """Build book title page."""
@@ -269,7 +360,7 @@ class ExportManager:
         author = book_metadata.get('author', 'Unknown Author')
         description = book_metadata.get('description', '')
         version = book_metadata.get('version', '1.0.0')
-        created_at = book_metadata.get('created_at', datetime.now().isoformat())
+        created_at = book_metadata.get('created_at', self._today)
 
         content = f"""---
 title: "{title}"
@@ -299,7 +390,8 @@ version: {version}
 
     def _build_table_of_contents(self, table_of_contents: Dict[str, Any]) -> str:
         """Build table of contents section."""
-        content = ["# Table of Contents\n\n"]
+        buf = io.StringIO()
+        buf.write("# Table of Contents\n\n")
 
         chapters = table_of_contents.get('chapters', [])
         for chapter in chapters:
@@ -307,19 +399,20 @@ version: {version}
             title = chapter.get('title', f'Chapter {num}')
             summary = chapter.get('summary', '')
 
-            content.append(f"{num}. **{title}**\n")
+            buf.write(f"{num}. **{title}**\n")
             if summary:
-                content.append(f"   {summary}\n")
-            content.append("\n")
+                buf.write(f"   {summary}\n")
+            buf.write("\n")
 
-        return "".join(content)
+        return buf.getvalue()
 
     def _build_glossary(self, terminology_glossary: Dict[str, Any]) -> str:
         """Build glossary/terminology section."""
         if not terminology_glossary:
             return "# Glossary\n\n*No terminology defined.*\n"
 
-        content = ["# Glossary\n\n"]
+        buf = io.StringIO()
+        buf.write("# Glossary\n\n")
 
         # Sort terms alphabetically
         sorted_terms = sorted(terminology_glossary.items())
@@ -329,45 +422,36 @@ version: {version}
             first_chapter = entry.get('first_introduced_chapter', 0)
             aliases = entry.get('aliases', [])
 
-            content.append(f"**{term}**\n")
-            content.append(f": {definition}\n")
+            buf.write(f"**{term}**\n: {definition}\n")
 
             if aliases:
-                content.append(f"  *Also known as: {', '.join(aliases)}*\n")
+                buf.write(f"  *Also known as: {', '.join(aliases)}*\n")
 
-            content.append(f"  *First introduced in Chapter {first_chapter}*\n")
-            content.append("\n")
+            buf.write(f"  *First introduced in Chapter {first_chapter}*\n\n")
 
-        return "".join(content)
+        return buf.getvalue()
 
     def _build_fact_check_appendix(self, fact_check_results: List[Dict[str, Any]]) -> str:
         """Build fact-checking appendix."""
-        content = ["# Appendix: Fact-Checking Report\n\n"]
+        buf = io.StringIO()
+        buf.write("# Appendix: Fact-Checking Report\n\n")
 
-        # Count by status
-        status_counts = {}
+        # Count by status and group by chapter in a single pass
+        status_counts = Counter()
+        by_chapter = defaultdict(list)
         for result in fact_check_results:
-            status = result.get('verification_status', 'unverified')
-            status_counts[status] = status_counts.get(status, 0) + 1
+            status_counts[result.get('verification_status', 'unverified')] += 1
+            by_chapter[result.get('chapter_number', 0)].append(result)
 
         # Summary
-        content.append("## Summary\n\n")
-        content.append(f"- Total Claims Verified: {len(fact_check_results)}\n")
+        buf.write(f"## Summary\n\n- Total Claims Verified: {len(fact_check_results)}\n")
         for status, count in status_counts.items():
-            content.append(f"- {status.title()}: {count}\n")
-        content.append("\n")
-
-        # Group by chapter
-        by_chapter = {}
-        for result in fact_check_results:
-            chapter = result.get('chapter_number', 0)
-            if chapter not in by_chapter:
-                by_chapter[chapter] = []
-            by_chapter[chapter].append(result)
+            buf.write(f"- {status.title()}: {count}\n")
+        buf.write("\n")
 
         # Detail by chapter
-        for chapter_num in sorted(by_chapter.keys()):
-            content.append(f"## Chapter {chapter_num}\n\n")
+        for chapter_num in sorted(by_chapter):
+            buf.write(f"## Chapter {chapter_num}\n\n")
 
             for result in by_chapter[chapter_num]:
                 claim = result.get('claim', '')
@@ -375,43 +459,37 @@ version: {version}
                 confidence = result.get('confidence_score', 0.0)
                 sources = result.get('sources', [])
 
-                content.append(f"**Claim:** {claim}\n")
-                content.append(f"- **Status:** {status}\n")
-                content.append(f"- **Confidence:** {confidence:.2f}\n")
+                buf.write(
+                    f"**Claim:** {claim}\n"
+                    f"- **Status:** {status}\n"
+                    f"- **Confidence:** {confidence:.2f}\n"
+                )
 
                 if sources:
-                    content.append(f"- **Sources:**\n")
+                    buf.write("- **Sources:**\n")
                     for source in sources[:5]:  # Limit to 5 sources
-                        content.append(f"  - {source}\n")
+                        buf.write(f"  - {source}\n")
 
-                content.append("\n")
+                buf.write("\n")
 
-        return "".join(content)
+        return buf.getvalue()
+
+    def _book_dir(self, book_metadata: Dict[str, Any]) -> Path:
+        """Return the book's output directory, creating it on first use."""
+        book_title = book_metadata.get('book_title', 'Untitled Book')
+        book_dir = self.output_dir / self._sanitize_filename(book_title)
+        if book_dir not in self._created_dirs:
+            book_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(book_dir)
+        return book_dir
 
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for filesystem."""
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-
-        # Limit length
-        if len(filename) > 100:
-            filename = filename[:100]
-
-        return filename.strip()
+        return _sanitize_filename(filename)
 
     def _check_pandoc_available(self, pandoc_cmd: str) -> bool:
         """Check if pandoc is available."""
-        try:
-            result = subprocess.run(
-                [pandoc_cmd, "--version"],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-            return False
+        return _check_pandoc_available(pandoc_cmd)
 
 
 # Convenience functions
@@ -437,7 +515,9 @@ def export_chapter_to_file(
     book_metadata = state.get('book_metadata', {})
     chapter_metadata = state.get('chapter_metadata')
 
-    # Filter formulas and diagrams for this chapter
+    # Filter formulas and diagrams for this chapter. Each call exports one
+    # chapter from a fresh state dict, so a single pass per list is all the
+    # work there is; an index cached on the state would never be reused.
     all_formulas = state.get('math_formulas', [])
     chapter_formulas = [
         f for f in all_formulas